@@ -4,14 +4,19 @@ Panacea code
 
 Function used to do initial validation of the Excel files
 """
+import os
 import uuid
 import re
+import weakref
+from collections import defaultdict
 from typing import Dict, Any, List, NamedTuple
 import logging
-from collections import namedtuple
-from openpyxl import Workbook
+from concurrent.futures import ThreadPoolExecutor
+from openpyxl import Workbook, load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.utils import get_column_letter, range_boundaries
+import numpy as np
 import pandas as pd
 from dqchecks.utils import create_validation_event_row_dataframe
 
@@ -29,6 +34,144 @@ PROCESS_MODEL_MAPPING = {
     "pcd": "Delta",
 }
 
+# Worksheet types accepted by the read-path check functions.
+# ReadOnlyWorksheet is what openpyxl returns for workbooks opened with read_only=True.
+_WORKSHEET_TYPES = (Worksheet, ReadOnlyWorksheet)
+
+# Precomputed column letters ("A" .. "XFD", Excel's maximum of 16384 columns) so
+# the hot loops index a list instead of redoing the base-26 conversion per cell.
+_COL_LETTERS = [None] + [get_column_letter(i) for i in range(1, 16385)]
+
+# Elementwise "is this value a formula" predicate over object arrays. The
+# predicate runs once per cell, so it uses the cheapest spellings available:
+# `type(v) is str` skips isinstance's subclass walk (cell values are never str
+# subclasses) and `v[:1] == "="` avoids the startswith method-call overhead.
+# pylint: disable-next=unidiomatic-typecheck
+_IS_FORMULA = np.frompyfunc(lambda v: type(v) is str and v[:1] == "=", 1, 1)
+
+def _diff_formula_grids(grid1, grid2):
+    """
+    Vectorized mismatch kernel over two equally-shaped 2D object grids.
+
+    Flags a coordinate when exactly one side holds a formula, or when both do
+    but the formula strings differ. The whole comparison runs in NumPy's C
+    loops; only the flagged coordinates are handed back to Python.
+
+    Args:
+        grid1 (np.ndarray): Template sheet values as a 2D object array.
+        grid2 (np.ndarray): Company sheet values as a 2D object array.
+
+    Returns:
+        tuple: (is_f1, is_f2, mismatch_coords) — the boolean formula masks for
+        each grid and an (n, 2) array of mismatching (row, column) indices.
+    """
+    is_f1 = _IS_FORMULA(grid1).astype(bool)
+    is_f2 = _IS_FORMULA(grid2).astype(bool)
+    mismatch = (is_f1 != is_f2) | (is_f1 & is_f2 & (grid1 != grid2))
+    return is_f1, is_f2, np.argwhere(mismatch)
+
+def _constant_categorical(value: str, size: int) -> pd.Categorical:
+    """
+    A length-`size` categorical column repeating a single value.
+
+    Stores one int8 code per row plus a single-entry categories index, instead
+    of `size` references to the same Python string in an object column.
+    """
+    return pd.Categorical.from_codes(np.zeros(size, dtype=np.int8), categories=[value])
+
+def _batch_event_ids(count: int) -> List[str]:
+    """
+    Generate `count` random 32-character hex event ids in one batch.
+
+    Equivalent to calling uuid.uuid4().hex once per row, but draws all the
+    entropy with a single os.urandom call instead of one syscall per id.
+    """
+    raw = os.urandom(16 * count)
+    return [raw[i:i + 16].hex() for i in range(0, 16 * count, 16)]
+
+# Column layouts of the validation-event DataFrames, plus cached empty frames
+# with those schemas. Builders return a copy of the cached frame when there are
+# no rows, so downstream pd.concat sees a properly-typed frame instead of a
+# column-less one it would have to reconcile.
+_MISSING_SHEET_COLUMNS = (
+    'Event_Id', 'Sheet_Cd', 'Rule_Cd',
+    'Error_Category', 'Error_Severity_Cd', 'Error_Desc')
+_FORMULA_ERROR_COLUMNS = (
+    'Event_Id', 'Sheet_Cd', 'Cell_Cd', 'Rule_Cd',
+    'Error_Category', 'Error_Severity_Cd', 'Error_Desc')
+_FORMULA_DIFFERENCE_COLUMNS = (
+    'Event_Id', 'Sheet_Cd', 'Rule_Cd', 'Cell_Cd',
+    'Error_Category', 'Error_Severity_Cd', 'Error_Desc')
+_EMPTY_MISSING_SHEET_DF = pd.DataFrame(
+    {col: pd.Series(dtype='object') for col in _MISSING_SHEET_COLUMNS})
+_EMPTY_FORMULA_ERROR_DF = pd.DataFrame(
+    {col: pd.Series(dtype='object') for col in _FORMULA_ERROR_COLUMNS})
+# The structure-discrepancy builder shares the missing-sheet column layout; the
+# formula-difference one has the same columns as the formula-error layout but
+# with Rule_Cd ahead of Cell_Cd.
+_EMPTY_STRUCTURE_DISCREPANCY_DF = pd.DataFrame(
+    {col: pd.Series(dtype='object') for col in _MISSING_SHEET_COLUMNS})
+_EMPTY_FORMULA_DIFFERENCE_DF = pd.DataFrame(
+    {col: pd.Series(dtype='object') for col in _FORMULA_DIFFERENCE_COLUMNS})
+
+def load_workbook_fast(path: str) -> Workbook:
+    """
+    Load a workbook in read-only mode for the read-path check functions.
+
+    Opening with `read_only=True` makes openpyxl stream the sheet XML instead of
+    materialising a Cell object per coordinate, which is dramatically faster and
+    lighter on memory for large files. The check functions in this module
+    (`find_formula_errors`, `find_missing_sheets`, `check_sheet_structure`, ...)
+    only read values and formulas, so callers should prefer this loader.
+
+    Note that read-only worksheets do not support random `sheet.cell()` access;
+    the check functions therefore iterate rows via `iter_rows` throughout.
+
+    Args:
+        path (str): Path to the .xlsx file to load.
+
+    Returns:
+        Workbook: The workbook opened with read_only=True and data_only=False.
+    """
+    return load_workbook(path, read_only=True, data_only=False, keep_links=False)
+
+# Optional Rust-backed value reader; much faster than openpyxl when only cell
+# values (not formulas) are needed. Kept optional so the package does not grow
+# a hard dependency — load_sheet_values falls back to openpyxl when absent.
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+def load_sheet_values(path: str, sheetname: str) -> List[list]:
+    """
+    Read one sheet's cell values as a list of row lists.
+
+    Uses python-calamine when it is installed, which parses the sheet XML in
+    Rust and is several times faster than openpyxl for value-only reads.
+    Falls back to a read-only openpyxl pass otherwise, so behaviour does not
+    depend on the optional package being present.
+
+    Only suitable for value-level checks (structure, headers, dimensions);
+    checks that inspect formulas must keep going through openpyxl, as calamine
+    returns computed values rather than formula strings.
+
+    Args:
+        path (str): Path to the .xlsx file to read.
+        sheetname (str): Name of the sheet whose values to return.
+
+    Returns:
+        List[list]: One list per row, each holding that row's cell values.
+    """
+    if CalamineWorkbook is not None:
+        return CalamineWorkbook.from_path(path).get_sheet_by_name(sheetname).to_python()
+
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        return [list(row) for row in wb[sheetname].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
 def validate_tabs_between_spreadsheets(spreadsheet1: Workbook, spreadsheet2: Workbook) -> dict:
     """
     Compares the sheet names between two openpyxl workbook objects to check if they are identical.
@@ -61,18 +204,22 @@ def validate_tabs_between_spreadsheets(spreadsheet1: Workbook, spreadsheet2: Wor
     # List of substrings to exclude
     excluded_substrings = ["Dict_", "CLEAR_SHEET", "Changes Log"]
 
-    # Filter sheet names that do not contain any of the excluded substrings
-    sheets1 = set(
+    # Filter sheet names that do not contain any of the excluded substrings,
+    # preserving each workbook's native sheet order
+    sheets1 = [
         sheet for sheet in spreadsheet1.sheetnames
             if not any(excluded in sheet for excluded in excluded_substrings)
-    )
-    sheets2 = set(sheet for sheet in spreadsheet2.sheetnames
+    ]
+    sheets2 = [sheet for sheet in spreadsheet2.sheetnames
             if not any(excluded in sheet for excluded in excluded_substrings)
-    )
+    ]
 
-    # Check for missing sheets in both spreadsheets
-    missing_in_1 = sheets2 - sheets1
-    missing_in_2 = sheets1 - sheets2
+    # Check for missing sheets in both spreadsheets; one set per side for
+    # membership tests, list comprehensions to keep the workbook ordering
+    sheets1_set = set(sheets1)
+    sheets2_set = set(sheets2)
+    missing_in_1 = [sheet for sheet in sheets2 if sheet not in sheets1_set]
+    missing_in_2 = [sheet for sheet in sheets1 if sheet not in sheets2_set]
 
     result = {
         "status": "Ok",
@@ -85,9 +232,9 @@ def validate_tabs_between_spreadsheets(spreadsheet1: Workbook, spreadsheet2: Wor
         result["description"] = "Spreadsheets have different sheet names."
         errors = {}
         if missing_in_1:
-            errors["Missing In Spreadsheet 1"] = list(missing_in_1)
+            errors["Missing In Spreadsheet 1"] = missing_in_1
         if missing_in_2:
-            errors["Missing In Spreadsheet 2"] = list(missing_in_2)
+            errors["Missing In Spreadsheet 2"] = missing_in_2
         result["errors"] = errors
 
     return result
@@ -227,15 +374,146 @@ class FormulaErrorSheetContext(NamedTuple):
         }
 
 
+class _SheetScan(NamedTuple):
+    """
+    Result of a single streaming pass over a worksheet.
+
+    Attributes:
+        max_row (int): Total number of rows in the sheet.
+        max_column (int): Total number of columns in the sheet.
+        last_used_row (int): The last non-empty row (0 if the sheet is empty).
+        last_used_column (int): The rightmost non-empty column (0 if empty).
+        header (tuple): The values of the requested header row, or () if no
+            header row was requested or the row does not exist.
+    """
+    max_row: int
+    max_column: int
+    last_used_row: int
+    last_used_column: int
+    header: tuple
+
+class _SheetData(NamedTuple):
+    """
+    One worksheet's extracted state, bundled for the report helpers.
+
+    Attributes:
+        scan (_SheetScan): The completed scan of the sheet.
+        title (str): The worksheet title, for the report messages.
+        grid (np.ndarray): The extracted value grid; only the formula
+            comparison needs it, so the structure path leaves the default.
+    """
+    scan: _SheetScan
+    title: str
+    grid: np.ndarray = None
+
+
+def _scan_rows(rows, header_row_number: int = 0) -> _SheetScan:
+    """
+    Core single-pass scan over an iterable of row value sequences.
+
+    Shared by _scan_sheet, which streams rows straight off a worksheet, and
+    the grid-based fused path, which scans a grid already held in memory.
+    """
+    max_row = 0
+    max_column = 0
+    last_used_row = 0
+    last_used_column = 0
+    header = ()
+
+    # Visit every row once; for each row find the rightmost non-empty cell,
+    # which updates both the last used row and the last used column. The
+    # overall dimensions are tracked during the same pass so that read-only
+    # worksheets (which may not know max_row/max_column upfront) work too.
+    for row_index, row_values in enumerate(rows, start=1):
+        max_row = row_index
+        max_column = max(max_column, len(row_values))
+        if row_index == header_row_number:
+            header = row_values
+        # Inline emptiness test (None or whitespace-only string) so the hot
+        # loop short-circuits on the first non-empty cell without a function
+        # call per cell.
+        for col_index in range(len(row_values), 0, -1):
+            val = row_values[col_index - 1]
+            if val is None:
+                continue
+            if isinstance(val, str) and not val.strip():
+                continue
+            last_used_row = row_index
+            last_used_column = max(last_used_column, col_index)
+            break
+
+    return _SheetScan(
+        max_row=max_row,
+        max_column=max_column,
+        last_used_row=last_used_row,
+        last_used_column=last_used_column,
+        header=header,
+    )
+
+
+def _dimension_bounds(sheet: Worksheet):
+    """
+    The (max_col, max_row) bounds recorded in the sheet XML, or (None, None)
+    when the dimension is unknown (e.g. some read-only sheets).
+    """
+    try:
+        _, _, dim_max_col, dim_max_row = range_boundaries(sheet.calculate_dimension())
+    except (AttributeError, TypeError, ValueError):
+        dim_max_col = dim_max_row = None
+    return dim_max_col, dim_max_row
+
+
+def _scan_sheet(sheet: Worksheet, header_row_number: int = 0) -> _SheetScan:
+    """
+    Scan a worksheet once, computing its dimensions, used area and (optionally)
+    the values of a header row.
+
+    Fuses the used-area traversal with the header read so the sheet XML is
+    streamed a single time instead of once per piece of information. The scan
+    is bounded by the dimension recorded in the sheet XML when available, so
+    it never streams past the writer's declared extent; the dimension alone
+    cannot replace the scan, because cells inside it may still be empty.
+    """
+    dim_max_col, dim_max_row = _dimension_bounds(sheet)
+    rows = sheet.iter_rows(max_row=dim_max_row, max_col=dim_max_col, values_only=True)
+    return _scan_rows(rows, header_row_number)
+
+
+def _sheet_grid(sheet: Worksheet) -> np.ndarray:
+    """
+    Read a worksheet into a 2D object array in a single streaming pass.
+
+    The grid holds the sheet's raw values (formulas as their "=" strings) up
+    to the recorded dimension. Extracting it once lets the structure scan and
+    the formula comparison share the same in-memory copy instead of each
+    re-streaming the sheet XML.
+    """
+    dim_max_col, dim_max_row = _dimension_bounds(sheet)
+    rows = list(sheet.iter_rows(max_row=dim_max_row, max_col=dim_max_col, values_only=True))
+    if not rows:
+        # A completely empty read-only sheet streams no rows at all; return a
+        # 1x1 None grid to match openpyxl's 1x1 dimensions for empty sheets,
+        # so the used-area clamps in the comparison paths slice a real cell
+        # instead of broadcasting an empty view.
+        return np.full((1, 1), None, dtype=object)
+
+    # Rows can come back ragged when the dimension is unknown; pad to the
+    # widest row so the result is rectangular.
+    width = max(len(row) for row in rows)
+    grid = np.empty((len(rows), width), dtype=object)
+    for i, row in enumerate(rows):
+        grid[i, :len(row)] = row
+    return grid
+
+
 def get_used_area(sheet: Worksheet) -> UsedArea:
     """
     Analyze the contents of an Excel worksheet and return the boundaries of the used area.
 
-    This function scans the worksheet to determine the last non-empty row and column, using a 
-    combination of binary search and sequential refinement. It accounts for intermittent empty 
-    rows or columns by examining a range around the current search midpoint and then performing 
-    final adjustments to pinpoint the exact last used index. It also calculates the number of 
-    empty rows and columns trailing at the bottom and right of the sheet, respectively.
+    This function streams the worksheet once via `iter_rows(values_only=True)` to determine
+    the last non-empty row and column, tolerating intermittent empty rows or columns in the
+    middle of the data. It also calculates the number of empty rows and columns trailing at
+    the bottom and right of the sheet, respectively.
 
     Args:
         sheet (Worksheet): An openpyxl Worksheet object to analyze.
@@ -255,60 +533,16 @@ def get_used_area(sheet: Worksheet) -> UsedArea:
         >>> area = get_used_area(ws)
         >>> print(area.last_used_row, area.last_used_column)
     """
-    if not isinstance(sheet, Worksheet):
+    if not isinstance(sheet, _WORKSHEET_TYPES):
         raise ValueError("The provided input is not a valid openpyxl Worksheet object.")
 
-    max_row, max_column = sheet.max_row, sheet.max_column
-
-    def is_column_empty(col: int) -> bool:
-        for row in range(1, max_row + 1):
-            val = sheet.cell(row=row, column=col).value
-            if isinstance(val, str):
-                if val.strip():
-                    return False
-            elif val is not None:
-                return False
-        return True
-
-    def is_row_empty(row: int) -> bool:
-        for col in range(1, max_column + 1):
-            val = sheet.cell(row=row, column=col).value
-            if isinstance(val, str):
-                if val.strip():
-                    return False
-            elif val is not None:
-                return False
-        return True
-
-    def binary_search(start: int, end: int, check_empty, max_index: int) -> int:
-        result = 0
-        while start <= end:
-            mid = (start + end) // 2
-            window = range(max(1, mid - 10), min(max_index, mid + 10) + 1)
-            has_data = not all(check_empty(i) for i in window)
-
-            if has_data:
-                result = max(result, mid)
-                start = mid + 1
-            else:
-                end = mid - 1
-
-        while result > 0 and check_empty(result):
-            result -= 1
-
-        return result
-
-    last_used_row = binary_search(1, max_row, is_row_empty, max_row)
-    last_used_column = binary_search(1, max_column, is_column_empty, max_column)
-
-    empty_rows = max_row - last_used_row
-    empty_columns = max_column - last_used_column
+    scan = _scan_sheet(sheet)
 
     return UsedArea(
-        empty_rows=empty_rows,
-        empty_columns=empty_columns,
-        last_used_row=max(1, last_used_row),
-        last_used_column=max(1, last_used_column),
+        empty_rows=scan.max_row - scan.last_used_row,
+        empty_columns=scan.max_column - scan.last_used_column,
+        last_used_row=max(1, scan.last_used_row),
+        last_used_column=max(1, scan.last_used_column),
     )
 
 def check_sheet_structure(sheet1: Worksheet, sheet2: Worksheet, header_row_number: int = 0):
@@ -353,32 +587,53 @@ def check_sheet_structure(sheet1: Worksheet, sheet2: Worksheet, header_row_numbe
         - The function compares the maximum number of rows and columns
         (`max_row` and `max_column`) of the sheets.
     """
-    errors = {}
-
     # Validate input types
-    if not isinstance(sheet1, Worksheet) or not isinstance(sheet2, Worksheet):
+    if not isinstance(sheet1, _WORKSHEET_TYPES) or not isinstance(sheet2, _WORKSHEET_TYPES):
         raise ValueError("Both inputs must be valid openpyxl worksheet objects.")
 
+    # One streaming pass per sheet yields the dimensions, the used area and
+    # the header row all at once.
+    scan1 = _scan_sheet(sheet1, header_row_number)
+    scan2 = _scan_sheet(sheet2, header_row_number)
+
+    return _structure_report(
+        _SheetData(scan1, sheet1.title),
+        _SheetData(scan2, sheet2.title),
+        header_row_number)
+
+def _structure_report(
+        data1: _SheetData,
+        data2: _SheetData,
+        header_row_number: int = 0) -> dict:
+    """
+    Build the check_sheet_structure report from two completed sheet scans.
+
+    Split out so the fused comparison path can reuse scans computed from
+    already-extracted grids without re-reading the worksheets.
+    """
+    errors = {}
+    scan1, scan2 = data1.scan, data2.scan
+
+    # A completely empty sheet yields no rows at all from iter_rows, whereas
+    # openpyxl reports its dimensions as 1x1; clamp so both look the same.
+    dims1 = (max(1, scan1.max_row), max(1, scan1.max_column))
+    dims2 = (max(1, scan2.max_row), max(1, scan2.max_column))
+
     # Check if both sheets are empty (either one row or one column)
-    if sheet1.max_row == sheet1.max_column == sheet2.max_row == sheet2.max_column == 1:
+    if dims1 == dims2 == (1, 1):
         # Both sheets are empty, so do nothing
         pass
     else:
         # Add error for sheet1 if it's empty (either 1 row or 1 column)
-        if sheet1.max_row == 1 or sheet1.max_column == 1:
-            errors.setdefault("Empty Sheet", []).append(sheet1.title)
+        if 1 in dims1:
+            errors.setdefault("Empty Sheet", []).append(data1.title)
 
         # Add error for sheet2 if it's empty (either 1 row or 1 column)
-        if sheet2.max_row == 1 or sheet2.max_column == 1:
-            errors.setdefault("Empty Sheet", []).append(sheet2.title)
+        if 1 in dims2:
+            errors.setdefault("Empty Sheet", []).append(data2.title)
 
-    # Get used area for both sheets
-    shape1 = get_used_area(sheet1)
-    shape1.validate()
-    rows1, cols1 = shape1.last_used_row, shape1.last_used_column
-    shape2 = get_used_area(sheet2)
-    shape2.validate()
-    rows2, cols2 = shape2.last_used_row, shape2.last_used_column
+    rows1, cols1 = max(1, scan1.last_used_row), max(1, scan1.last_used_column)
+    rows2, cols2 = max(1, scan2.last_used_row), max(1, scan2.last_used_column)
 
     # Check if the number of rows and columns are the same
     if (rows1, cols1) != (rows2, cols2):
@@ -391,9 +646,10 @@ def check_sheet_structure(sheet1: Worksheet, sheet2: Worksheet, header_row_numbe
     header2 = []
 
     if header_row_number > 0:
-        # Check if the column headers are the same (both name and order)
-        header1 = [sheet1.cell(row=header_row_number, column=c).value for c in range(1, cols1 + 1)]
-        header2 = [sheet2.cell(row=header_row_number, column=c).value for c in range(1, cols2 + 1)]
+        # Check if the column headers are the same (both name and order),
+        # padding the captured header rows with None to the used width
+        header1 = list(scan1.header[:cols1]) + [None] * (cols1 - len(scan1.header[:cols1]))
+        header2 = list(scan2.header[:cols2]) + [None] * (cols2 - len(scan2.header[:cols2]))
 
     if header1 != header2:
         # Find out which columns are different
@@ -416,7 +672,7 @@ def check_sheet_structure(sheet1: Worksheet, sheet2: Worksheet, header_row_numbe
     return {
         "status": "Ok",
         "description":
-            f"Spreadsheets '{sheet1.title}' and '{sheet2.title}' have the same structure.",
+            f"Spreadsheets '{data1.title}' and '{data2.title}' have the same structure.",
         "errors": {}
     }
 
@@ -427,47 +683,101 @@ def compare_formulas(sheet1, sheet2):
     Returns:
         dict: A dictionary with status, description, and any differences.
     """
-    if not isinstance(sheet1, Worksheet) or not isinstance(sheet2, Worksheet):
+    if not isinstance(sheet1, _WORKSHEET_TYPES) or not isinstance(sheet2, _WORKSHEET_TYPES):
         raise ValueError("Both inputs must be valid openpyxl worksheet objects.")
 
-    shape1 = get_used_area(sheet1)
-    shape1.validate()
-    shape2 = get_used_area(sheet2)
-    shape2.validate()
+    # Extract each sheet once and scan the in-memory grid, instead of
+    # streaming the sheet XML separately for the used area and the values
+    grid1 = _sheet_grid(sheet1)
+    grid2 = _sheet_grid(sheet2)
+
+    return _formula_report(
+        _SheetData(_scan_rows(grid1), sheet1.title, grid1),
+        _SheetData(_scan_rows(grid2), sheet2.title, grid2))
+
+def _iter_formula_differences(
+        used1: np.ndarray,
+        used2: np.ndarray,
+        title1: str,
+        title2: str):
+    """
+    Yield one (cell_name, messages) pair per cell whose formulas differ.
+
+    A generator so consumers stream the differences straight into their own
+    containers — the report dict in _formula_report, the flat row lists in
+    the cross-sheet aggregators — without holding an intermediate dict of
+    every error alongside the output. Expects both grids already trimmed to
+    the same used area.
+    """
+    is_f1, is_f2, mismatch_coords = _diff_formula_grids(used1, used2)
+
+    for r, c in mismatch_coords:
+        v1, v2 = used1[r, c], used2[r, c]
+        cell_name = f"{_COL_LETTERS[c + 1]}{r + 1}"
+        if is_f1[r, c] and is_f2[r, c]:
+            yield cell_name, [
+                f"Template: {title1}!{cell_name} ({v1}) "
+                f"!= {title2}!{cell_name} ({v2}) :Company"]
+        else:
+            val1 = f"Formula: {v1}" if is_f1[r, c] else f"Value: {v1}"
+            val2 = f"Formula: {v2}" if is_f2[r, c] else f"Value: {v2}"
+            yield cell_name, [
+                f"Template: {title1}!{cell_name} ({val1}) "
+                f"!= {title2}!{cell_name} ({val2}) :Company"]
+
+def _formula_difference_sheet_rows(data1: _SheetData, data2: _SheetData) -> tuple:
+    """
+    Stream one sheet's formula differences into parallel row lists.
+
+    The aggregators' counterpart of _formula_report: consumes the difference
+    generator directly into the (cell_refs, desc_lists) shape they
+    accumulate, skipping the report dict entirely. Mismatched dimensions are
+    the structure check's concern, so that case yields no rows — matching
+    the empty errors dict compare_formulas reports for it.
+    """
+    rows1, cols1 = max(1, data1.scan.last_used_row), max(1, data1.scan.last_used_column)
+    rows2, cols2 = max(1, data2.scan.last_used_row), max(1, data2.scan.last_used_column)
 
-    if (shape1.last_used_row, shape1.last_used_column) !=\
-        (shape2.last_used_row, shape2.last_used_column):
+    cell_refs: List[str] = []
+    desc_lists: List[list] = []
+
+    if (rows1, cols1) == (rows2, cols2):
+        for cell_name, messages in _iter_formula_differences(
+                data1.grid[:rows1, :cols1], data2.grid[:rows2, :cols2],
+                data1.title, data2.title):
+            cell_refs.append(cell_name)
+            desc_lists.append(messages)
+
+    return cell_refs, desc_lists
+
+def _formula_report(data1: _SheetData, data2: _SheetData) -> dict:
+    """
+    Build the compare_formulas report from two extracted grids and their scans.
+
+    Split out so the fused comparison path can reuse grids and scans computed
+    once per sheet without re-reading the worksheets.
+    """
+    rows1, cols1 = max(1, data1.scan.last_used_row), max(1, data1.scan.last_used_column)
+    rows2, cols2 = max(1, data2.scan.last_used_row), max(1, data2.scan.last_used_column)
+
+    if (rows1, cols1) != (rows2, cols2):
         return {
             "status": "Error",
             "description": (
-                f"Sheets have different dimensions: '{sheet1.title}' in template has "
-                f"{shape1.last_used_row} rows & {shape1.last_used_column} columns, "
-                f"'{sheet2.title}' in company has {shape2.last_used_row} rows & "
-                f"{shape2.last_used_column} columns."
+                f"Sheets have different dimensions: '{data1.title}' in template has "
+                f"{rows1} rows & {cols1} columns, "
+                f"'{data2.title}' in company has {rows2} rows & "
+                f"{cols2} columns."
             ),
             "errors": {}
         }
 
-    differing_cells = {}
-
-    for row in range(1, shape1.last_used_row + 1):
-        for col in range(1, shape1.last_used_column + 1):
-            c1, c2 = sheet1.cell(row=row, column=col), sheet2.cell(row=row, column=col)
-
-            is_f1, is_f2 = c1.data_type == "f", c2.data_type == "f"
-
-            if is_f1 and is_f2 and c1.value != c2.value:
-                differing_cells.setdefault(f"{get_column_letter(col)}{row}", []).append(
-                    f"Template: {sheet1.title}!{get_column_letter(col)}{row} ({c1.value}) "
-                    f"!= {sheet2.title}!{get_column_letter(col)}{row} ({c2.value}) :Company"
-                )
-            elif is_f1 != is_f2:
-                val1 = f"Formula: {c1.value}" if is_f1 else f"Value: {c1.value}"
-                val2 = f"Formula: {c2.value}" if is_f2 else f"Value: {c2.value}"
-                differing_cells.setdefault(f"{get_column_letter(col)}{row}", []).append(
-                    f"Template: {sheet1.title}!{get_column_letter(col)}{row} ({val1}) "
-                    f"!= {sheet2.title}!{get_column_letter(col)}{row} ({val2}) :Company"
-                )
+    # Trim both grids to the used area and stream the differences into the
+    # report dict; every mismatching coordinate appears exactly once, so the
+    # build is one plain insertion per yielded cell
+    differing_cells = dict(_iter_formula_differences(
+        data1.grid[:rows1, :cols1], data2.grid[:rows2, :cols2],
+        data1.title, data2.title))
 
     if differing_cells:
         return {
@@ -505,38 +815,44 @@ def check_formula_errors(sheet):
         print(result)
     """
     # Validate input types
-    if not isinstance(sheet, Worksheet):
+    if not isinstance(sheet, _WORKSHEET_TYPES):
         raise ValueError("Input must be valid openpyxl worksheet object.")
 
-    error_details = {}
-
-    shape = get_used_area(sheet)
-    shape.validate()
+    # Group error cells by error string in one dict operation per cell
+    error_details = defaultdict(list)
+
+    # pylint: disable=W0212
+    cells = getattr(sheet, "_cells", None)
+    if cells is not None:
+        # Most sheets contain no error cells at all: a quick any() scan over
+        # the populated cells lets those return before any grouping work.
+        if not any(cell.data_type == 'e' for cell in cells.values()):
+            return {"status": "Ok", "description": "No errors found", "errors": {}}
+        # Regular worksheets keep only populated cells in the _cells dict
+        # (row-major insertion order), so iterating it skips every empty
+        # coordinate instead of materialising Cell objects for the whole grid.
+        candidates = cells.values()
+    else:
+        # Read-only worksheets have no _cells dict; stream the rows instead.
+        candidates = (cell for row in sheet.iter_rows() for cell in row)
 
-    # Iterate over all cells in the sheet
-    for n_col, row in enumerate(sheet.iter_rows()):
-        if n_col > shape.last_used_row:
-            break
-        for cell in row[:shape.last_used_column]:
-            # Check if the cell contains an error (identified by an 'e')
-            if cell.data_type == 'e':
-                # If the formula's output is one of the known error strings
-                if isinstance(cell.value, str):
-                    cell_name = f"{get_column_letter(cell.column)}{cell.row}"
-                    # Group errors by type
-                    if cell.value not in error_details:
-                        error_details[cell.value] = []
-                    error_details[cell.value].append(cell_name)
+    for cell in candidates:
+        # Check if the cell contains an error (identified by an 'e')
+        # whose value is one of the known error strings
+        if cell.data_type == 'e' and isinstance(cell.value, str):
+            # Group errors by type
+            error_details[cell.value].append(f"{_COL_LETTERS[cell.column]}{cell.row}")
 
     # If no errors were found, return the status as "Ok"
     if not error_details:
         return {"status": "Ok", "description": "No errors found", "errors": {}}
 
-    # If errors were found, return the status as "Error" with the grouped error details
+    # If errors were found, return the status as "Error" with the grouped error
+    # details (converted back to a plain dict for API parity)
     return {
         "status": "Error",
         "description": "Found errors",
-        "errors": error_details
+        "errors": dict(error_details)
     }
 
 class MissingSheetContext(NamedTuple):
@@ -634,18 +950,20 @@ class MissingSheetRow(NamedTuple):
         }
 
 
-def create_missing_sheet_row(sheet: str, context: MissingSheetContext) -> MissingSheetRow:
+def create_missing_sheet_row(
+        sheet: str,
+        context: MissingSheetContext) -> MissingSheetRow:
     """
     Creates a dictionary representing a row for a missing sheet.
-    
+
     Args:
         sheet (str): The name or identifier of the missing sheet.
-        context (MissingSheetContext): The context containing error details like 
+        context (MissingSheetContext): The context containing error details like
                                       Rule_Cd, Error_Category, and Error_Severity_Cd.
-    
+
     Returns:
         dict: A dictionary containing the details of the missing sheet.
-    
+
     Raises:
         ValueError: If 'sheet' is not a string, if 'context' does not contain
                     the required fields, or if 'context' validation fails.
@@ -664,12 +982,9 @@ def create_missing_sheet_row(sheet: str, context: MissingSheetContext) -> Missin
     except ValueError as e:
         raise ValueError(f"Invalid context: {str(e)}") from e
 
-    # Generate a unique Event_Id using uuid4
-    eventid = uuid.uuid4().hex
-
     # Return the NamedTuple representing the missing sheet row
     return MissingSheetRow(
-        Event_Id=eventid,
+        Event_Id=uuid.uuid4().hex,
         Sheet_Cd=sheet,
         Rule_Cd=context.Rule_Cd,
         Error_Category=context.Error_Category,
@@ -712,20 +1027,35 @@ def create_dataframe_missing_sheets(input_data: dict, context: MissingSheetConte
     if not isinstance(missing_sheets, list):
         missing_sheets = []  # Fallback to empty list if not a valid list
 
-    # Create an empty list to store rows for each missing sheet
-    rows = []
-
-    # Create a row for each sheet in the missing sheets list
+    # Validate every sheet name before building any rows
     for sheet in missing_sheets:
         if not isinstance(sheet, str) or not sheet:
             # pylint: disable=C0301
             raise ValueError(f"Invalid sheet name: '{sheet}'. Each sheet must be a non-empty string.")
-        rows.append(create_missing_sheet_row(sheet, context).to_dict())
-
-    # Convert the list of rows into a pandas DataFrame
-    df = pd.DataFrame(rows)
 
-    return df
+    # Validate the context once (rather than per row) when there are rows to build
+    if missing_sheets:
+        try:
+            context.validate()
+        except ValueError as e:
+            raise ValueError(f"Invalid context: {str(e)}") from e
+
+    # Build the DataFrame column-wise (one list per column) so pandas does not
+    # have to hash per-row dict keys or re-infer the schema row by row. The
+    # constant context columns are stored as single-value categoricals; the
+    # context is only validated (and hence guaranteed non-null) when rows exist.
+    n = len(missing_sheets)
+    if not n:
+        return _EMPTY_MISSING_SHEET_DF.copy()
+
+    return pd.DataFrame({
+        'Event_Id': _batch_event_ids(n),
+        'Sheet_Cd': list(missing_sheets),
+        'Rule_Cd': _constant_categorical(context.Rule_Cd, n),
+        'Error_Category': _constant_categorical(context.Error_Category, n),
+        'Error_Severity_Cd': _constant_categorical(context.Error_Severity_Cd, n),
+        'Error_Desc': ["Missing Sheet"] * n,
+    })
 
 
 def find_missing_sheets(wb_template: Workbook, wb_company: Workbook):
@@ -815,13 +1145,13 @@ def create_row_for_error(sheet_cd: str, error_type: str, cell:str,
                          context: FormulaErrorSheetContext):
     """
     Creates a row dictionary for a single formula error.
-    
+
     Args:
         sheet_cd (str): The sheet code.
         error_type (str): The type of error (e.g., #DIV/0!).
         cell (str): The cell reference where the error occurred.
         context (FormulaErrorSheetContext): The context with error details.
-    
+
     Returns:
         dict: A dictionary representing a row for the error.
     """
@@ -861,16 +1191,30 @@ def create_dataframe_formula_errors(input_data: dict, context: FormulaErrorSheet
     # Extract error rows from the input data
     error_rows = extract_error_rows(input_data)
 
-    # Create the rows for the DataFrame
-    rows = []
+    # Collect the per-row columns as parallel lists (struct-of-arrays) so
+    # pandas does not have to hash per-row dict keys or re-infer the schema
+    cell_refs = []
+    error_descs = []
     for error_type, cells in error_rows:
         for cell in cells:
-            # Create a row for each cell error
-            row = create_row_for_error(context.Sheet_Cd, error_type, cell, context)
-            rows.append(row)
-
-    # Convert the list of rows into a pandas DataFrame
-    df = pd.DataFrame(rows)
+            cell_refs.append(cell)
+            error_descs.append(error_type)
+
+    # Build the DataFrame column-wise; the constant context fields are stored
+    # as single-value categoricals (validate_input_data guarantees them non-null)
+    n = len(cell_refs)
+    if not n:
+        return _EMPTY_FORMULA_ERROR_DF.copy()
+
+    df = pd.DataFrame({
+        'Event_Id': _batch_event_ids(n),
+        'Sheet_Cd': _constant_categorical(context.Sheet_Cd, n),
+        'Cell_Cd': cell_refs,
+        'Rule_Cd': _constant_categorical(context.Rule_Cd, n),
+        'Error_Category': _constant_categorical(context.Error_Category, n),
+        'Error_Severity_Cd': _constant_categorical(context.Error_Severity_Cd, n),
+        'Error_Desc': error_descs,
+    })
 
     return df
 
@@ -887,60 +1231,112 @@ def find_formula_errors(wb: Workbook):
     
     Raises:
         ValueError: If the 'wb' argument is not an instance of openpyxl Workbook.
-    
+
     This function loops through all sheets in the provided workbook,
         runs formula checks on each sheet,
-    creates a context for each sheet's errors, and generates
-        a DataFrame of formula errors. The individual 
-    DataFrames are then concatenated to produce one
-        final DataFrame that contains all the formula errors from 
-    all sheets.
+    and collects the error rows from every sheet into one set of flat
+        columns, from which a single consolidated
+    DataFrame is built at the end.
     """
 
     # Input validation for the 'wb' argument (must be a valid openpyxl Workbook)
     if not isinstance(wb, Workbook):
         raise ValueError("The 'wb' argument must be a valid openpyxl Workbook.")
 
-    # Initialize an empty list to store DataFrames for each sheet's formula errors
-    all_formula_error_dfs = []
+    # Collect the rows from every sheet into shared flat columns; building the
+    # DataFrame exactly once avoids one DataFrame allocation per sheet plus the
+    # final concat copy.
+    sheet_cds = []
+    cell_refs = []
+    error_descs = []
+
+    # wb.worksheets is an already-materialised list, so iterating it avoids a
+    # Workbook.__getitem__ name lookup per sheet
+    worksheets = wb.worksheets
+    sheetnames = [sheet.title for sheet in worksheets]
+
+    # Scan the sheets concurrently; each sheet's check is independent and
+    # executor.map preserves sheet order in the collected results.
+    if worksheets:
+        with ThreadPoolExecutor(max_workers=min(8, len(worksheets))) as executor:
+            results = list(executor.map(check_formula_errors, worksheets))
+    else:
+        results = []
+
+    # Append each sheet's error rows to the shared columns
+    for sheetname, formula_errors in zip(sheetnames, results):
+        for error_type, cells in extract_error_rows(formula_errors):
+            for cell in cells:
+                sheet_cds.append(sheetname)
+                cell_refs.append(cell)
+                error_descs.append(error_type)
+
+    # Build the final DataFrame containing all formula errors from all sheets;
+    # Sheet_Cd shares one categories index built from the workbook's sheets
+    n = len(cell_refs)
+    final_formula_error_df = pd.DataFrame({
+        'Event_Id': _batch_event_ids(n),
+        'Sheet_Cd': pd.Categorical(sheet_cds, categories=sheetnames),
+        'Cell_Cd': cell_refs,
+        'Rule_Cd': _constant_categorical("Rule 2: Formula Error Check", n),
+        'Error_Category': _constant_categorical("Formula Error", n),
+        'Error_Severity_Cd': _constant_categorical("hard", n),
+        'Error_Desc': error_descs,
+    })
+
+    return final_formula_error_df
 
-    # Loop through each sheet in the workbook
-    for sheetname in wb.sheetnames:
-        # Run formula checks for the current sheet and store the results
-        formula_errors = check_formula_errors(wb[sheetname])
+class StructureDiscrepancyContext(NamedTuple):
+    """
+    A NamedTuple representing the context of a structure discrepancy on a worksheet.
 
-        # Create a context object for the current sheet with formula error details
-        formula_error_sheet_context = FormulaErrorSheetContext(
-            Rule_Cd="Rule 2: Formula Error Check",
-            Sheet_Cd=sheetname,
-            Error_Category="Formula Error",
-            Error_Severity_Cd="hard",  # Placeholder for error severity
-        )
+    Attributes:
+        Rule_Cd (str): The code of the rule associated with the discrepancy.
+        Sheet_Cd (str): The code of the sheet where the discrepancy occurred.
+        Error_Category (str): The category of the error.
+        Error_Severity_Cd (str): The severity code of the error.
+    """
+    Rule_Cd: str
+    Sheet_Cd: str
+    Error_Category: str
+    Error_Severity_Cd: str
 
-        # Create a DataFrame for the current sheet's formula errors using the helper function
-        sheet_error_df = create_dataframe_formula_errors(
-            formula_errors,
-            formula_error_sheet_context)
+def _structure_discrepancy_rows(input_data: Dict[str, Any]) -> List[list]:
+    """
+    Validate a structure report and extract its raw rows.
 
-        # Append the DataFrame for the current sheet to the list
-        all_formula_error_dfs.append(sheet_error_df)
+    Returns one list of discrepancy descriptions per error type, ready to be
+    joined into an Error_Desc column. Keeping the extraction separate from the
+    DataFrame build lets the cross-sheet aggregators collect rows from every
+    sheet first and build a single DataFrame at the end.
 
-    # Concatenate all the DataFrames in the list into one large DataFrame
-    final_formula_error_df = pd.concat(all_formula_error_dfs, ignore_index=True)
+    :param input_data: The check_sheet_structure output dictionary.
+    :type input_data: dict
 
-    # Return the final concatenated DataFrame containing all formula errors from all sheets
-    return final_formula_error_df
+    :return: One description list per discrepancy row.
+    :rtype: List[list]
 
-# Define namedtuple for context
-StructureDiscrepancyContext = namedtuple(
-    'StructureDiscrepancyContext', 
-    [
-        'Rule_Cd',
-        'Sheet_Cd',
-        'Error_Category',
-        'Error_Severity_Cd',
-    ]
-)
+    :raises ValueError: If 'input_data' does not contain a valid 'errors' dict.
+    """
+    if 'errors' not in input_data or not isinstance(input_data['errors'], dict):
+        raise ValueError("The 'input_data' must contain an 'errors' field of type dictionary.")
+
+    input_errors = input_data['errors']
+
+    # Validate every discrepancy before building any columns
+    for errortype, discrepancy in input_errors.items():
+        # Check that the discrepancy is a list or tuple, and each element is a string
+        if not isinstance(discrepancy, (list, tuple)):
+            raise ValueError(
+                f"The discrepancy for '{errortype}' must be a list or tuple.")
+
+        if not all(isinstance(d, str) for d in discrepancy):
+            raise ValueError(
+                f"Each item in the discrepancy list for '{errortype}' must be a string.")
+
+    # Build the per-row column in one exact-size comprehension (no append
+    # growth) so pandas does not have to re-infer the schema row by row
+    return [list(discrepancy) for discrepancy in input_errors.values()]
 
 def create_dataframe_structure_discrepancies(
         input_data: Dict[str, Any],
@@ -976,14 +1372,9 @@ def create_dataframe_structure_discrepancies(
     if not isinstance(context, StructureDiscrepancyContext):
         raise TypeError("The 'context' must be an instance of StructureDiscrepancyContext.")
 
-    if 'errors' not in input_data or not isinstance(input_data['errors'], dict):
-        raise ValueError("The 'input_data' must contain an 'errors' field of type dictionary.")
-
-    # Extract context values
-    rule_cd = context.Rule_Cd
-    error_severity_cd = context.Error_Severity_Cd
-    sheet_cd = context.Sheet_Cd
-    error_category = context.Error_Category
+    # Extract context values in one tuple unpack so the row loop below does
+    # no per-row attribute lookups
+    rule_cd, sheet_cd, error_category, error_severity_cd = context
 
     # Validate context values
     if not all([rule_cd, error_severity_cd, sheet_cd, error_category]):
@@ -991,42 +1382,179 @@ def create_dataframe_structure_discrepancies(
             "The 'context' contains missing values. Ensure all context " +\
                 "attributes are properly set.")
 
-    # Create an empty list to store rows
-    rows = []
-
-    # Extract and process structure discrepancies from the input data
-    for errortype, discrepancy in input_data['errors'].items():
-        # Check that the discrepancy is a list or tuple, and each element is a string
-        if not isinstance(discrepancy, (list, tuple)):
-            raise ValueError(
-                f"The discrepancy for '{errortype}' must be a list or tuple.")
+    desc_lists = _structure_discrepancy_rows(input_data)
+
+    n = len(desc_lists)
+    if not n:
+        return _EMPTY_STRUCTURE_DISCREPANCY_DF.copy()
+
+    # Join the discrepancy details in one vectorized C-level pass rather than
+    # one Python-level str.join per row
+    error_descs = pd.Series(desc_lists, dtype=object).str.join(" -- ")
+
+    # Build the DataFrame column-wise with every dtype stated up front, so
+    # pandas never runs inference: the Event IDs come from one batched draw,
+    # the constant context values are stored as single-value categoricals
+    # (one int8 code per row instead of n string references) and the free-text
+    # columns use the pandas string dtype
+    return pd.DataFrame({
+        'Event_Id': pd.array(_batch_event_ids(n), dtype='string'),
+        'Sheet_Cd': _constant_categorical(sheet_cd, n),
+        'Rule_Cd': _constant_categorical(rule_cd, n),
+        'Error_Category': _constant_categorical(error_category, n),
+        'Error_Severity_Cd': _constant_categorical(error_severity_cd, n),
+        'Error_Desc': error_descs.astype('string'),
+    })
+
+# Per-(template, company) cache of common sheet names; see _common_sheet_pairs.
+_COMMON_SHEETNAMES_CACHE = weakref.WeakKeyDictionary()
+
+# Optional: pyarrow-backed string storage halves memory again versus the
+# default string dtype and makes concatenation a chunked-array append. Like
+# python-calamine above, it stays an optional import rather than a dependency.
+try:
+    import pyarrow  # pylint: disable=unused-import
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+def _arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Move string columns onto pyarrow-backed storage when pyarrow is installed.
 
-        if not all(isinstance(d, str) for d in discrepancy):
-            raise ValueError(
-                f"Each item in the discrepancy list for '{errortype}' must be a string.")
+    A no-op without pyarrow, so the returned frame's values are the same
+    either way — only the backing storage differs.
+    """
+    if not _HAS_PYARROW:
+        return df
+    string_cols = {
+        col: 'string[pyarrow]'
+        for col in df.columns if isinstance(df[col].dtype, pd.StringDtype)}
+    if not string_cols:
+        return df
+    return df.astype(string_cols)
+
+def _structure_discrepancy_frame(
+        sheet_cds: List[str],
+        desc_lists: List[list],
+        sheetnames: List[str]) -> pd.DataFrame:
+    """
+    Build the combined structure-discrepancy report from rows of every sheet.
+
+    Takes the raw rows the aggregators collected across all common sheets and
+    builds a single DataFrame: one batched Event_Id draw, one vectorized
+    Error_Desc join and one categorical Sheet_Cd column for the whole report,
+    instead of a per-sheet DataFrame plus a final concat.
+
+    :param sheet_cds: One sheet name per discrepancy row.
+    :type sheet_cds: List[str]
+    :param desc_lists: One description list per discrepancy row.
+    :type desc_lists: List[list]
+    :param sheetnames: Every common sheet name, in template order; used as the
+        Sheet_Cd categories so the dtype is stable across runs.
+    :type sheetnames: List[str]
+
+    :return: The Rule 4 structural-discrepancy report.
+    :rtype: pandas.DataFrame
+    """
+    n = len(desc_lists)
+    if not n:
+        return _arrow_strings(_EMPTY_STRUCTURE_DISCREPANCY_DF.copy())
+
+    # Join the discrepancy details in one vectorized C-level pass rather than
+    # one Python-level str.join per row
+    error_descs = pd.Series(desc_lists, dtype=object).str.join(" -- ")
+
+    return _arrow_strings(pd.DataFrame({
+        'Event_Id': pd.array(_batch_event_ids(n), dtype='string'),
+        'Sheet_Cd': pd.Categorical(sheet_cds, categories=sheetnames),
+        'Rule_Cd': _constant_categorical("Rule 4: Structural Discrepancy", n),
+        'Error_Category': _constant_categorical("Structure Discrepancy", n),
+        'Error_Severity_Cd': _constant_categorical("hard", n),
+        'Error_Desc': error_descs.astype('string'),
+    }))
+
+def _formula_difference_frame(
+        sheet_cds: List[str],
+        cell_refs: List[str],
+        desc_lists: List[list],
+        sheetnames: List[str]) -> pd.DataFrame:
+    """
+    Build the combined formula-difference report from rows of every sheet.
+
+    The formula-comparison counterpart of _structure_discrepancy_frame: the
+    aggregators hand over the raw rows from all common sheets and one
+    DataFrame is built at the end, with no per-sheet frames to concatenate.
+
+    :param sheet_cds: One sheet name per differing cell.
+    :type sheet_cds: List[str]
+    :param cell_refs: One cell reference per differing cell.
+    :type cell_refs: List[str]
+    :param desc_lists: One description list per differing cell.
+    :type desc_lists: List[list]
+    :param sheetnames: Every common sheet name, in template order; used as the
+        Sheet_Cd categories so the dtype is stable across runs.
+    :type sheetnames: List[str]
+
+    :return: The Rule 1 formula-difference report.
+    :rtype: pandas.DataFrame
+    """
+    n = len(cell_refs)
+    if not n:
+        return _arrow_strings(_EMPTY_FORMULA_DIFFERENCE_DF.copy())
+
+    # Join the description lists in one vectorized C-level pass rather than
+    # one Python-level str.join per row
+    error_descs = pd.Series(desc_lists, dtype=object).str.join(" -- ")
+
+    return _arrow_strings(pd.DataFrame({
+        'Event_Id': pd.array(_batch_event_ids(n), dtype='string'),
+        'Sheet_Cd': pd.Categorical(sheet_cds, categories=sheetnames),
+        'Rule_Cd': _constant_categorical("Rule 1: Formula Difference", n),
+        'Cell_Cd': pd.array(cell_refs, dtype='string'),
+        'Error_Category': _constant_categorical("Formula Difference", n),
+        'Error_Severity_Cd': _constant_categorical("hard", n),
+        'Error_Desc': error_descs.astype('string'),
+    }))
+
+def _common_sheet_pairs(wb_template: Workbook, wb_company: Workbook) -> List[tuple]:
+    """
+    Pair up the worksheets the two workbooks have in common.
 
-        # Create a row for each discrepancy (in this case, row/column count differences)
-        row = {
-            # Generate a unique Event ID
-            'Event_Id': uuid.uuid4().hex,
-            # The sheet code for the error
-            'Sheet_Cd': sheet_cd,
-            # Rule code (e.g., validation rule)
-            'Rule_Cd': rule_cd,
-            # The category of the error
-            'Error_Category': error_category,
-            # The severity of the error
-            'Error_Severity_Cd': error_severity_cd,
-            # Join the discrepancy details into a single string
-            'Error_Desc': " -- ".join(discrepancy),
-        }
-        rows.append(row)
+    Computes the sheet-name intersection once and binds each worksheet object
+    a single time, so callers do not repeat the Workbook.__getitem__ lookups
+    (a linear scan through the sheet list each) for every per-sheet check.
 
-    # Convert the list of rows into a pandas DataFrame
-    df = pd.DataFrame(rows)
+    Args:
+        wb_template (Workbook): The template workbook.
+        wb_company (Workbook): The company workbook.
 
-    # Return the resulting DataFrame
-    return df
+    Returns:
+        List[tuple]: One (sheetname, template_worksheet, company_worksheet)
+        triple per common sheet.
+    """
+    # Memoise the name intersection per workbook pair: running several
+    # validators over the same two workbooks (the typical pattern) recomputes
+    # nothing. Weak references keep the cache from pinning workbooks in
+    # memory, and only the name list is stored — holding worksheet objects
+    # here would keep a strong path back to the key workbook and defeat the
+    # weak keys. Assumes the sheet list is not mutated between validator
+    # calls on the same pair.
+    per_template = _COMMON_SHEETNAMES_CACHE.get(wb_template)
+    if per_template is None:
+        per_template = weakref.WeakKeyDictionary()
+        _COMMON_SHEETNAMES_CACHE[wb_template] = per_template
+
+    common = per_template.get(wb_company)
+    if common is None:
+        # One set for membership, a list comprehension for the order: the
+        # common sheets come out in the template workbook's sheet order, so
+        # every run produces the report rows deterministically
+        company_names = set(wb_company.sheetnames)
+        common = [name for name in wb_template.sheetnames if name in company_names]
+        per_template[wb_company] = common
+
+    return [(name, wb_template[name], wb_company[name]) for name in common]
 
 def find_shape_differences(wb_template: Workbook, wb_company: Workbook) -> pd.DataFrame:
     """
@@ -1057,53 +1585,80 @@ def find_shape_differences(wb_template: Workbook, wb_company: Workbook) -> pd.Da
     if not isinstance(wb_template, Workbook) or not isinstance(wb_company, Workbook):
         raise TypeError("Both inputs must be instances of openpyxl Workbook.")
 
-    # Initialize an empty list to store individual DataFrames for discrepancies
-    all_shape_error_dfs: List[pd.DataFrame] = []
-
-    # Loop through each sheet in both workbooks and find common sheet names
-    common_sheetnames = set(wb_template.sheetnames).intersection(set(wb_company.sheetnames))
+    # Pair up the sheets both workbooks share, binding each worksheet once
+    common_pairs = _common_sheet_pairs(wb_template, wb_company)
 
-    if not common_sheetnames:
+    if not common_pairs:
         logger.warning("No common sheets found between the template and company workbooks.")
 
-    for sheetname in common_sheetnames:
-        # Create the context for the current sheet
-        context = StructureDiscrepancyContext(
-            Rule_Cd="Rule 4: Structural Discrepancy",
-            Sheet_Cd=sheetname,  # Specify the sheet name with the issue
-            Error_Category="Structure Discrepancy",
-            Error_Severity_Cd="hard"
-        )
+    def check_one_sheet(pair: tuple) -> tuple:
+        sheetname, ws_template, ws_company = pair
 
         # only fOut_ sheets have somewhat consistent headers on row 2
         header_row_number = 2 if sheetname.startswith("fOut_") else 0
 
         # Check for structure discrepancies in the current sheet
-        discrepancies = check_sheet_structure(
-            wb_template[sheetname],
-            wb_company[sheetname],
-            header_row_number)
+        discrepancies = check_sheet_structure(ws_template, ws_company, header_row_number)
+
+        return sheetname, _structure_discrepancy_rows(discrepancies)
 
-        # If discrepancies are found, create a DataFrame
-        df = create_dataframe_structure_discrepancies(discrepancies, context)
-        all_shape_error_dfs.append(df)
+    # Accumulate the raw rows from every sheet rather than building a
+    # DataFrame per sheet only to concatenate them again: one DataFrame is
+    # built at the end from the combined rows
+    sheet_cds: List[str] = []
+    desc_lists: List[list] = []
+
+    # Compare the sheets concurrently; each sheet's check is independent and
+    # executor.map preserves sheet order in the collected results
+    if common_pairs:
+        with ThreadPoolExecutor(max_workers=min(8, len(common_pairs))) as executor:
+            for sheetname, rows in executor.map(check_one_sheet, common_pairs):
+                sheet_cds.extend([sheetname] * len(rows))
+                desc_lists.extend(rows)
 
     # If no discrepancies were found, return an empty DataFrame
-    if not all_shape_error_dfs:
+    if not desc_lists:
         logger.info("No structure discrepancies were found in any sheet.")
-        return pd.DataFrame()  # Return an empty DataFrame if no discrepancies
+        return _EMPTY_STRUCTURE_DISCREPANCY_DF.copy()
 
-    # Concatenate all DataFrames in the list to create one big DataFrame
-    final_shape_error_df = pd.concat(all_shape_error_dfs, ignore_index=True)
+    final_shape_error_df = _structure_discrepancy_frame(
+        sheet_cds, desc_lists, [name for name, _, _ in common_pairs])
 
     # Return the final DataFrame containing all the discrepancies
     logger.info("Found %s structure discrepancies across sheets.", len(final_shape_error_df))
     return final_shape_error_df
 
-# Define namedtuple for context
-FormulaDifferencesContext = namedtuple(
-    'FormulaDifferencesContext', ['Rule_Cd', 'Sheet_Cd', 'Error_Category', 'Error_Severity_Cd']
-)
+class FormulaDifferencesContext(NamedTuple):
+    """
+    A NamedTuple representing the context of a formula difference on a worksheet.
+
+    Attributes:
+        Rule_Cd (str): The code of the rule associated with the difference.
+        Sheet_Cd (str): The code of the sheet where the difference occurred.
+        Error_Category (str): The category of the error.
+        Error_Severity_Cd (str): The severity code of the error.
+    """
+    Rule_Cd: str
+    Sheet_Cd: str
+    Error_Category: str
+    Error_Severity_Cd: str
+
+def _formula_difference_rows(input_data: dict) -> tuple:
+    """
+    Extract the raw formula-difference rows from a compare_formulas report.
+
+    Returns the cell references and description lists as two parallel lists,
+    so the cross-sheet aggregators can collect rows from every sheet first
+    and build a single DataFrame at the end.
+
+    :param input_data: The compare_formulas output dictionary.
+    :type input_data: dict
+
+    :return: A (cell_refs, desc_lists) pair of parallel lists.
+    :rtype: tuple
+    """
+    errors = input_data.get("errors", {})
+    return list(errors.keys()), list(errors.values())
 
 def create_dataframe_formula_differences(
         input_data: dict,
@@ -1144,11 +1699,9 @@ def create_dataframe_formula_differences(
     if not isinstance(context, FormulaDifferencesContext):
         raise ValueError("context must be an instance of FormulaDifferencesContext.")
 
-    # Extract context values
-    rule_cd = context.Rule_Cd
-    error_category = context.Error_Category
-    error_severity_cd = context.Error_Severity_Cd
-    sheet_cd = context.Sheet_Cd
+    # Extract context values in one tuple unpack so the row loop below does
+    # no per-row attribute lookups
+    rule_cd, sheet_cd, error_category, error_severity_cd = context
 
      # Validate context values
     if not all([rule_cd, error_severity_cd, sheet_cd, error_category]):
@@ -1156,30 +1709,33 @@ def create_dataframe_formula_differences(
             "The 'context' contains missing values. Ensure all context " +\
                 "attributes are properly set.")
 
-    # Create an empty list to store rows
-    rows = []
-
-    errors = input_data.get("errors", {})
-
-    # Extract the formula discrepancies
-    for cellreference, discrepancies in errors.items():
-        # Create a row for each discrepancy (a list of error descriptions)
-        row = {
-            'Event_Id': uuid.uuid4().hex,
-            'Sheet_Cd': sheet_cd,
-            'Rule_Cd': rule_cd,
-            'Cell_Cd': cellreference,
-            'Error_Category': error_category,
-            'Error_Severity_Cd': error_severity_cd,
-            'Error_Desc': " -- ".join(discrepancies),  # Join the error descriptions with " -- "
-        }
-        rows.append(row)
-
-    # Convert the list of rows into a pandas DataFrame
-    df = pd.DataFrame(rows)
-
-    # Return the resulting DataFrame
-    return df
+    # Extract the formula discrepancies as flat columns (struct-of-arrays):
+    # the cell references are the dict keys; no per-row dicts for pandas to
+    # transpose
+    cell_refs, desc_lists = _formula_difference_rows(input_data)
+
+    n = len(cell_refs)
+    if not n:
+        return _EMPTY_FORMULA_DIFFERENCE_DF.copy()
+
+    # Join the description lists in one vectorized C-level pass rather than
+    # one Python-level str.join per row
+    error_descs = pd.Series(desc_lists, dtype=object).str.join(" -- ")
+
+    # Build the DataFrame column-wise with every dtype stated up front, so
+    # pandas never runs inference: the Event IDs come from one batched draw,
+    # the constant context values are stored as single-value categoricals
+    # (one int8 code per row instead of n string references) and the free-text
+    # columns use the pandas string dtype
+    return pd.DataFrame({
+        'Event_Id': pd.array(_batch_event_ids(n), dtype='string'),
+        'Sheet_Cd': _constant_categorical(sheet_cd, n),
+        'Rule_Cd': _constant_categorical(rule_cd, n),
+        'Cell_Cd': pd.array(cell_refs, dtype='string'),
+        'Error_Category': _constant_categorical(error_category, n),
+        'Error_Severity_Cd': _constant_categorical(error_severity_cd, n),
+        'Error_Desc': error_descs.astype('string'),
+    })
 
 def find_formula_differences(wb_template: Workbook, wb_company: Workbook) -> pd.DataFrame:
     """
@@ -1208,36 +1764,123 @@ def find_formula_differences(wb_template: Workbook, wb_company: Workbook) -> pd.
     if not isinstance(wb_template, Workbook) or not isinstance(wb_company, Workbook):
         raise TypeError("Both inputs must be instances of openpyxl Workbook.")
 
-    # Initialize an empty list to store individual DataFrames
-    all_formula_difference_dfs = []
+    # Pair up the sheets both workbooks share, binding each worksheet once
+    common_pairs = _common_sheet_pairs(wb_template, wb_company)
+
+    def compare_one_sheet(pair: tuple) -> tuple:
+        sheetcd, ws_template, ws_company = pair
+
+        # Extract each sheet once and stream the differences straight into
+        # row lists, with no intermediate report dict
+        grid_template = _sheet_grid(ws_template)
+        grid_company = _sheet_grid(ws_company)
+
+        return sheetcd, _formula_difference_sheet_rows(
+            _SheetData(_scan_rows(grid_template), ws_template.title, grid_template),
+            _SheetData(_scan_rows(grid_company), ws_company.title, grid_company))
+
+    # Accumulate the raw rows from every sheet rather than building a
+    # DataFrame per sheet only to concatenate them again: one DataFrame is
+    # built at the end from the combined rows
+    sheet_cds: List[str] = []
+    cell_refs: List[str] = []
+    desc_lists: List[list] = []
+
+    # Compare the sheets concurrently; each sheet's comparison is independent
+    # and executor.map preserves sheet order in the collected results
+    if common_pairs:
+        with ThreadPoolExecutor(max_workers=min(8, len(common_pairs))) as executor:
+            for sheetcd, (refs, descs) in executor.map(compare_one_sheet, common_pairs):
+                sheet_cds.extend([sheetcd] * len(refs))
+                cell_refs.extend(refs)
+                desc_lists.extend(descs)
 
-    # Loop through each sheet in both workbooks and find common sheet names
-    common_sheetnames = set(wb_template.sheetnames).intersection(set(wb_company.sheetnames))
+    # Return the final DataFrame containing all the formula differences
+    return _formula_difference_frame(
+        sheet_cds, cell_refs, desc_lists, [name for name, _, _ in common_pairs])
 
-    # Loop through each common sheet to compare formulas
-    for sheetcd in common_sheetnames:
-        # Create the context for the current sheet
-        context = FormulaDifferencesContext(
-            Rule_Cd="Rule 1: Formula Difference",
-            Sheet_Cd=sheetcd,  # Specify the sheet name with the issue
-            Error_Category="Formula Difference",
-            Error_Severity_Cd="hard"
-        )
+def find_all_differences(wb_template: Workbook, wb_company: Workbook):
+    """
+    Runs the structure and formula comparisons in one pass over the common sheets.
+
+    Calling find_shape_differences and find_formula_differences separately
+    traverses every common worksheet twice. This function visits each sheet
+    pair once, runs both checks on it, and returns both reports, halving the
+    worksheet traffic when callers need the full comparison.
+
+    :param wb_template: The template workbook to compare against.
+    :type wb_template: openpyxl.Workbook
+    :param wb_company: The company workbook to compare.
+    :type wb_company: openpyxl.Workbook
+
+    :return: A (shape_differences, formula_differences) tuple of DataFrames,
+        each with the same contents find_shape_differences and
+        find_formula_differences would produce on their own.
+    :rtype: tuple
+
+    :raises TypeError: If the input workbooks are not instances of
+        `openpyxl.Workbook`.
+    """
+    # Input validation
+    if not isinstance(wb_template, Workbook) or not isinstance(wb_company, Workbook):
+        raise TypeError("Both inputs must be instances of openpyxl Workbook.")
+
+    # Pair up the sheets both workbooks share, binding each worksheet once
+    common_pairs = _common_sheet_pairs(wb_template, wb_company)
 
-        # Compare formulas between the template and company workbooks for the current sheet
-        a = compare_formulas(wb_template[sheetcd], wb_company[sheetcd])
+    if not common_pairs:
+        logger.warning("No common sheets found between the template and company workbooks.")
 
-        # Generate the DataFrame for the current sheet's formula differences
-        df = create_dataframe_formula_differences(a, context)
+    def check_one_pair(pair: tuple) -> tuple:
+        sheetname, ws_template, ws_company = pair
 
-        # Append the DataFrame for this sheet to the list
-        all_formula_difference_dfs.append(df)
+        # only fOut_ sheets have somewhat consistent headers on row 2
+        header_row_number = 2 if sheetname.startswith("fOut_") else 0
 
-    # Concatenate all DataFrames in the list to create one big DataFrame
-    final_formula_difference_df = pd.concat(all_formula_difference_dfs, ignore_index=True)
+        # Extract each worksheet into a grid once and share it between both
+        # checks, so each sheet's XML is streamed a single time
+        grid_template = _sheet_grid(ws_template)
+        grid_company = _sheet_grid(ws_company)
+        data_template = _SheetData(
+            _scan_rows(grid_template, header_row_number), ws_template.title, grid_template)
+        data_company = _SheetData(
+            _scan_rows(grid_company, header_row_number), ws_company.title, grid_company)
+
+        discrepancies = _structure_report(data_template, data_company, header_row_number)
+
+        return (
+            sheetname,
+            _structure_discrepancy_rows(discrepancies),
+            _formula_difference_sheet_rows(data_template, data_company),
+        )
 
-    # Return the final DataFrame containing all the formula differences
-    return final_formula_difference_df
+    # Accumulate the raw rows from every sheet and build each report's
+    # DataFrame once at the end, rather than one frame per sheet plus a concat
+    shape_sheet_cds: List[str] = []
+    shape_desc_lists: List[list] = []
+    formula_sheet_cds: List[str] = []
+    formula_cell_refs: List[str] = []
+    formula_desc_lists: List[list] = []
+
+    # Compare the sheets concurrently; each sheet's checks are independent and
+    # executor.map preserves sheet order in the collected results.
+    if common_pairs:
+        with ThreadPoolExecutor(max_workers=min(8, len(common_pairs))) as executor:
+            for sheetname, shape_rows, (refs, descs) in executor.map(
+                    check_one_pair, common_pairs):
+                shape_sheet_cds.extend([sheetname] * len(shape_rows))
+                shape_desc_lists.extend(shape_rows)
+                formula_sheet_cds.extend([sheetname] * len(refs))
+                formula_cell_refs.extend(refs)
+                formula_desc_lists.extend(descs)
+
+    sheetnames = [name for name, _, _ in common_pairs]
+
+    return (
+        _structure_discrepancy_frame(shape_sheet_cds, shape_desc_lists, sheetnames),
+        _formula_difference_frame(
+            formula_sheet_cds, formula_cell_refs, formula_desc_lists, sheetnames),
+    )
 
 def check_value_in_cell(
         workbook: Workbook,
@@ -1414,20 +2057,27 @@ def create_dataframe_from_company_selection_check(input_data: Dict[str, Any]) ->
     # Create a list to store rows for the DataFrame
     rows = []
 
-    # If there are errors, iterate through the list of errors to create rows
+    # Bind uuid4 locally so the loop skips the module attribute lookup per row
+    uuid4 = uuid.uuid4
+
+    # If there are errors, iterate through the list of errors to create rows as
+    # plain tuples; column names are supplied once to from_records below
     for error in errors:
-        rows.append({
-            'Event_Id': uuid.uuid4().hex,  # Generate a unique ID for each event
-            'Sheet_Cd': meta["sheet_name"],  # Extract the sheet name from 'meta'
-            'Cell_Cd': meta["cell_name"],  # Extract the cell reference from 'meta'
-            'Rule_Cd': "Rule 7: Company Name Selected",  # Static rule code for company name selection
-            'Error_Category': "Company name mismatch",  # Static error category
-            'Error_Severity_Cd': "?",  # Placeholder for error severity
-            'Error_Desc': error  # Error description from the 'errors' list
-        })
+        rows.append((
+            uuid4().hex,  # Generate a unique ID for each event
+            meta["sheet_name"],  # Extract the sheet name from 'meta'
+            meta["cell_name"],  # Extract the cell reference from 'meta'
+            "Rule 7: Company Name Selected",  # Static rule code for company name selection
+            "Company name mismatch",  # Static error category
+            "?",  # Placeholder for error severity
+            error,  # Error description from the 'errors' list
+        ))
 
     # Convert the list of rows into a pandas DataFrame
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame.from_records(
+        rows,
+        columns=["Event_Id", "Sheet_Cd", "Cell_Cd", "Rule_Cd", "Error_Category",
+                 "Error_Severity_Cd", "Error_Desc"])
 
     return df
 
@@ -1478,19 +2128,23 @@ def create_dataframe_from_company_acronym_check(input_data: Dict[str, Any]) -> p
                                      "Error_Severity_Cd", "Error_Desc"])
 
     rows = []
+    uuid4 = uuid.uuid4
 
     for error in errors:
-        rows.append({
-            'Event_Id': uuid.uuid4().hex,
-            'Sheet_Cd': meta["sheet_name"],
-            'Cell_Cd': meta["cell_name"],
-            'Rule_Cd': "Rule 8: Company Acronym Check",
-            'Error_Category': "Company acronym mismatch",
-            'Error_Severity_Cd': "?",
-            'Error_Desc': error
-        })
-
-    return pd.DataFrame(rows)
+        rows.append((
+            uuid4().hex,
+            meta["sheet_name"],
+            meta["cell_name"],
+            "Rule 8: Company Acronym Check",
+            "Company acronym mismatch",
+            "?",
+            error,
+        ))
+
+    return pd.DataFrame.from_records(
+        rows,
+        columns=["Event_Id", "Sheet_Cd", "Cell_Cd", "Rule_Cd", "Error_Category",
+                 "Error_Severity_Cd", "Error_Desc"])
 
 def check_for_nulls_and_duplicates(
     worksheet, column_index, skip_rows, skip_row_after_header, working_area: UsedArea):
@@ -1675,34 +2329,41 @@ def find_pk_errors(
     rows = []
     error_data = error_data.get("errors", {})
 
+    # Local binding avoids the per-row module attribute lookup in the loops below
+    uuid4 = uuid.uuid4
+
     # Now handle null rows (missing values) for each sheet
     for sheet_name, sheet_errors in error_data.items():
         # Handling null rows (missing values)
         if sheet_errors.get('null_rows', []):
             null_rows_str = ', '.join(map(str, sheet_errors['null_rows']))
-            rows.append({
-                'Event_Id': uuid.uuid4().hex,
-                'Sheet_Cd': sheet_name,
-                'Rule_Cd': "Rule 6: Missing Boncode Check",
-                'Error_Category': "Missing Values",
-                'Error_Severity_Cd': "?",
-                "Error_Desc": f"Rows {null_rows_str} have missing values in [{header_column_name}]."
-            })
+            rows.append((
+                uuid4().hex,
+                sheet_name,
+                "Rule 6: Missing Boncode Check",
+                "Missing Values",
+                "?",
+                f"Rows {null_rows_str} have missing values in [{header_column_name}].",
+            ))
 
         # Handling duplicate rows
         for duplicate_value, rows_with_duplicate in sheet_errors.get('duplicate_rows', {}).items():
             rows_with_duplicate_str = ', '.join(map(str, rows_with_duplicate))
-            rows.append({
-                'Event_Id': uuid.uuid4().hex,
-                'Sheet_Cd': sheet_name,
-                'Rule_Cd': "Rule 5: Boncode Repetition",
-                'Error_Category': "Duplicate Value",
-                'Error_Severity_Cd': "?",
-                "Error_Desc": f"Duplicate [{header_column_name}] value '{duplicate_value}' found in rows {rows_with_duplicate_str}."
-            })
-
-    # Create the DataFrame from the list of rows
-    df = pd.DataFrame(rows)
+            rows.append((
+                uuid4().hex,
+                sheet_name,
+                "Rule 5: Boncode Repetition",
+                "Duplicate Value",
+                "?",
+                f"Duplicate [{header_column_name}] value '{duplicate_value}' found in rows {rows_with_duplicate_str}.",
+            ))
+
+    # Create the DataFrame from the list of tuples; naming the columns here
+    # avoids building one dict per row just to carry the same six keys
+    df = pd.DataFrame.from_records(
+        rows,
+        columns=["Event_Id", "Sheet_Cd", "Rule_Cd", "Error_Category",
+                 "Error_Severity_Cd", "Error_Desc"])
 
     return df
 
@@ -1803,30 +2464,26 @@ def create_same_desc_diff_boncode_validation_event(
     # Get unique Measure_Cd and Measure_Desc pairs
     measure_desc_pairs = df[['Measure_Cd', 'Measure_Desc']].drop_duplicates()
 
-    # Find descriptions used with multiple different Measure_Cd (boncodes)
-    duplicated_descs = (
-        measure_desc_pairs.groupby('Measure_Desc')
-        .filter(lambda x: x['Measure_Cd'].nunique() > 1)
-    )
+    # Find descriptions used with multiple different Measure_Cd (boncodes);
+    # a vectorized nunique per description replaces the per-group filter lambda
+    boncodes_per_desc = measure_desc_pairs.groupby('Measure_Desc')['Measure_Cd'].nunique()
+    duplicated_descs = boncodes_per_desc.index[boncodes_per_desc > 1]
 
     if duplicated_descs.empty:
         logger.info("No description used with multiple Measure_Cd values found.")
         return create_validation_event_row_dataframe().dropna()
 
-    # Merge back to original dataframe to get Sheet_Cd
-    merged_df = df.merge(
-        duplicated_descs[['Measure_Desc']].drop_duplicates(),
-        on='Measure_Desc',
-        how='inner'
-    )[['Measure_Desc', 'Measure_Cd', 'Sheet_Cd']].drop_duplicates()
-
-    # Group and format message
-    grouped = merged_df.groupby('Measure_Desc')
-    result = [
-        [f"{row.Measure_Cd} -- {row.Sheet_Cd}" for _, row in group.iterrows()]
-        for _, group in grouped
-    ]
-    message = ", ".join(["[" + ", ".join(group) + "]" for group in result])
+    # Select the offending rows to get Sheet_Cd (keeps the input row order,
+    # like the previous inner merge)
+    merged_df = df.loc[
+        df['Measure_Desc'].isin(duplicated_descs),
+        ['Measure_Desc', 'Measure_Cd', 'Sheet_Cd']].drop_duplicates()
+
+    # Format the message with vectorized string concatenation and one
+    # C-level join per description instead of iterrows
+    combos = merged_df['Measure_Cd'].astype(str) + " -- " + merged_df['Sheet_Cd'].astype(str)
+    joined = combos.groupby(merged_df['Measure_Desc']).agg(", ".join)
+    message = ", ".join("[" + group + "]" for group in joined)
 
     logger.warning(
         "Detected same description used with multiple Measure_Cd values: %s",
@@ -0,0 +1,62 @@
+"""
+Tests for the find_all_differences function
+found in the panacea.py file
+"""
+import pytest
+from dqchecks.panacea import find_all_differences
+from dqchecks.tests.test_find_formula_differences import create_test_workbook
+
+def test_find_all_differences_with_formula_differences():
+    """The formula report should flag differing formulas in one pass"""
+    template_data = [
+        ["Total", "=SUM(C1:C2)", 10],
+        ["Part", 4, 20],
+    ]
+    wb_template = create_test_workbook(template_data)
+
+    company_data = [
+        ["Total", "=SUM(C1:C99)", 10],  # Formula differs, same shape
+        ["Part", 4, 20],
+    ]
+    wb_company = create_test_workbook(company_data)
+
+    shape_df, formula_df = find_all_differences(wb_template, wb_company)
+
+    assert shape_df.empty
+    assert not formula_df.empty
+    assert set(formula_df["Rule_Cd"].to_list()) == {"Rule 1: Formula Difference"}
+
+def test_find_all_differences_with_shape_differences():
+    """The shape report should flag sheets with different dimensions"""
+    template_data = [
+        ["Total", "=SUM(C1:C2)", 10],
+        ["Part", 4, 20],
+    ]
+    wb_template = create_test_workbook(template_data)
+
+    company_data = template_data + [["Extra", 5, 30]]  # Extra row
+    wb_company = create_test_workbook(company_data)
+
+    shape_df, _ = find_all_differences(wb_template, wb_company)
+
+    assert not shape_df.empty
+    assert set(shape_df["Rule_Cd"].to_list()) == {"Rule 4: Structural Discrepancy"}
+
+def test_find_all_differences_no_differences():
+    """Identical workbooks should produce two empty reports"""
+    data = [
+        ["Total", "=SUM(C1:C2)", 10],
+        ["Part", 4, 20],
+    ]
+    wb_template = create_test_workbook(data)
+    wb_company = create_test_workbook(data)
+
+    shape_df, formula_df = find_all_differences(wb_template, wb_company)
+
+    assert shape_df.empty
+    assert formula_df.empty
+
+def test_find_all_differences_invalid_workbook_type():
+    """Invalid workbook types should raise a TypeError"""
+    with pytest.raises(TypeError, match="Both inputs must be instances of openpyxl Workbook."):
+        find_all_differences([], [])
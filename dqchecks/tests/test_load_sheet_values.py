@@ -0,0 +1,19 @@
+"""
+Tests for the load_sheet_values helper in panacea.py
+"""
+import pytest
+from dqchecks.panacea import load_sheet_values
+from dqchecks.tests.test_load_workbook_fast import create_test_file
+
+def test_load_sheet_values_returns_rows(tmp_path):
+    """The helper should return one list of values per row."""
+    path = create_test_file(tmp_path, [["Name", "Age"], ["Alice", 30]], title="Data")
+    rows = load_sheet_values(path, "Data")
+    assert rows[0][:2] == ["Name", "Age"]
+    assert rows[1][:2] == ["Alice", 30]
+
+def test_load_sheet_values_unknown_sheet_raises(tmp_path):
+    """An unknown sheet name should raise rather than return empty data."""
+    path = create_test_file(tmp_path, [[1]], title="Data")
+    with pytest.raises(Exception):
+        load_sheet_values(path, "NoSuchSheet")
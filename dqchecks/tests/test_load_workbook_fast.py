@@ -0,0 +1,50 @@
+"""
+Tests for the load_workbook_fast helper in panacea.py
+"""
+from openpyxl import Workbook
+from dqchecks.panacea import (
+    load_workbook_fast,
+    get_used_area,
+    check_formula_errors,
+    check_sheet_structure)
+
+def create_test_file(tmp_path, data, title=None):
+    """Helper function to save a workbook with the given rows to disk."""
+    wb = Workbook()
+    sheet = wb.active
+    if title is not None:
+        sheet.title = title
+    for row in data:
+        sheet.append(row)
+    path = tmp_path / "test.xlsx"
+    wb.save(path)
+    return str(path)
+
+def test_load_workbook_fast_is_read_only(tmp_path):
+    """The helper should open the workbook in read-only mode."""
+    path = create_test_file(tmp_path, [[1, 2], [3, 4]])
+    wb = load_workbook_fast(path)
+    assert wb.read_only
+
+def test_get_used_area_on_read_only_sheet(tmp_path):
+    """get_used_area should work on a read-only worksheet."""
+    path = create_test_file(tmp_path, [[1, 2, 3], [4, 5, 6], [None, None, None]])
+    wb = load_workbook_fast(path)
+    result = get_used_area(wb.active)
+    assert result.last_used_row == 2
+    assert result.last_used_column == 3
+
+def test_check_formula_errors_on_read_only_sheet(tmp_path):
+    """check_formula_errors should work on a read-only worksheet."""
+    path = create_test_file(tmp_path, [[10], [20], ["=A1+A2"]])
+    wb = load_workbook_fast(path)
+    result = check_formula_errors(wb.active)
+    assert result == {"status": "Ok", "description": "No errors found", "errors": {}}
+
+def test_check_sheet_structure_on_read_only_sheets(tmp_path):
+    """check_sheet_structure should work on read-only worksheets."""
+    path = create_test_file(tmp_path, [["Name", "Age"], ["Alice", 30]])
+    wb1 = load_workbook_fast(path)
+    wb2 = load_workbook_fast(path)
+    result = check_sheet_structure(wb1.active, wb2.active, header_row_number=1)
+    assert result["status"] == "Ok"